@@ -1,31 +1,92 @@
 """
 SalesAnalyzer class for data loading, cleaning, and analysis
 """
+import os
+from collections import Counter
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from models import EntityFactory
 
+try:
+    import polars as pl
+except ImportError:  # polars is optional, only needed for use_polars=True
+    pl = None
+
+try:
+    import pyarrow
+except ImportError:  # pyarrow is optional, without it data stays CSV-only
+    pyarrow = None
+
+
+def _parquet_sibling(path):
+    """Return the .parquet path next to a CSV path"""
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def _fresh_parquet(csv_path):
+    """Return the Parquet sibling of csv_path if it exists and is up to date"""
+    parquet_path = _parquet_sibling(csv_path)
+    if pyarrow is None or not os.path.exists(parquet_path):
+        return None
+    if (os.path.exists(csv_path)
+            and os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)):
+        return None
+    return parquet_path
+
 
 class SalesAnalyzer:
     """Main analyzer class for sales data"""
 
-    def __init__(self, data_path="data/sales_data.csv"):
+    def __init__(self, data_path="data/sales_data.csv", use_polars=False):
+        if use_polars and pl is None:
+            raise ImportError("polars is required for use_polars=True")
         self.data_path = data_path
+        self.use_polars = use_polars
+        self.lf = None
         self.raw_df = None
         self.clean_df = None
+        self._completed = None
+        self._customer_counts = None
         self.factory = EntityFactory()
 
     def load_data(self):
-        """Load CSV data into DataFrame"""
-        self.raw_df = pd.read_csv(self.data_path)
-        print(f"📊 Loaded {len(self.raw_df)} records from {self.data_path}")
+        """Load data into DataFrame, preferring an up-to-date Parquet copy
+
+        With use_polars only a lazy scan is set up; raw_df is read on demand
+        by inspect_data and clean_data.
+        """
+        parquet_path = _fresh_parquet(self.data_path)
+        source = parquet_path or self.data_path
+        if self.use_polars:
+            # Lazy scan, nothing is read until an aggregation collects it
+            if parquet_path is not None:
+                self.lf = pl.scan_parquet(parquet_path)
+            else:
+                # Read amounts as text so bad values coerce to null in _polars_clean
+                self.lf = pl.scan_csv(self.data_path, try_parse_dates=True,
+                                      schema_overrides={'order_amount': pl.String})
+            print(f"📊 Scanning {source} lazily with Polars")
+            return self.lf
+
+        self._read_raw_df()
+        return self.raw_df
+
+    def _read_raw_df(self):
+        """Read the source data eagerly into raw_df"""
+        parquet_path = _fresh_parquet(self.data_path)
+        if parquet_path is not None:
+            self.raw_df = pd.read_parquet(parquet_path, engine='pyarrow')
+        else:
+            self.raw_df = pd.read_csv(self.data_path)
+        source = parquet_path or self.data_path
+        print(f"📊 Loaded {len(self.raw_df)} records from {source}")
         return self.raw_df
 
     def inspect_data(self):
         """Inspect data structure and quality"""
         if self.raw_df is None:
-            self.load_data()
+            self._read_raw_df()
 
         print("\n" + "="*40)
         print("DATA INSPECTION")
@@ -42,7 +103,7 @@ class SalesAnalyzer:
     def clean_data(self):
         """Clean and prepare data for analysis"""
         if self.raw_df is None:
-            self.load_data()
+            self._read_raw_df()
 
         df = self.raw_df.copy()
 
@@ -56,85 +117,190 @@ class SalesAnalyzer:
 
         # 2. Convert data types
         print("2. Converting data types...")
-        df['order_date'] = pd.to_datetime(df['order_date'], errors='coerce')
+        df['order_date'] = pd.to_datetime(df['order_date'], format='%Y-%m-%d',
+                                          errors='coerce', cache=True)
         df['order_amount'] = pd.to_numeric(df['order_amount'], errors='coerce')
         df['unit_price'] = pd.to_numeric(df['unit_price'], errors='coerce')
 
         # 3. Remove invalid entries
         print("3. Removing invalid entries...")
         initial_count = len(df)
-        df = df[df['order_amount'] > 0]
-        df = df[df['quantity'] > 0]
+        mask = ((df['order_amount'].to_numpy() > 0)
+                & (df['quantity'].to_numpy() > 0))
+        df = df.loc[mask]
         removed_count = initial_count - len(df)
         print(f"   Removed {removed_count} invalid entries")
 
         # 4. Remove duplicates
         print("4. Removing duplicates...")
         initial_count = len(df)
-        df = df.drop_duplicates(subset=['order_id'], keep='first')
+        df = df.drop_duplicates(subset=['order_id'], keep='first',
+                                ignore_index=True)
         removed_duplicates = initial_count - len(df)
         print(f"   Removed {removed_duplicates} duplicate orders")
 
+        # 5. Store low-cardinality text columns as categoricals
+        print("5. Converting text columns to categories...")
+        for col in ('customer_id', 'product_category', 'status', 'product_name'):
+            df[col] = df[col].astype('category')
+
         self.clean_df = df
+        # Completed orders are reused by most analyses, filter them once
+        self._completed = df.loc[df['status'].values == 'completed']
+        # Orders per customer, shared by customer_count and the repeat rate
+        counts = df['customer_id'].value_counts(sort=False).to_numpy()
+        self._customer_counts = counts[counts > 0]
         print(f"\n✅ Cleaning complete!")
         print(f"   Final shape: {df.shape}")
 
         return df
 
     def export_clean_data(self, output_path="data/sales_clean.csv"):
-        """Export cleaned data to CSV"""
+        """Export cleaned data to CSV, plus a Parquet copy when pyarrow is available"""
         if self.clean_df is None:
             self.clean_data()
 
         self.clean_df.to_csv(output_path, index=False)
         print(f"✅ Clean data exported to {output_path}")
+        if pyarrow is not None:
+            parquet_path = _parquet_sibling(output_path)
+            self.clean_df.to_parquet(parquet_path, engine='pyarrow',
+                                     compression='zstd', index=False)
+            print(f"✅ Clean data exported to {parquet_path}")
         return output_path
 
     def calculate_metrics(self):
         """Calculate key business metrics"""
+        if self.use_polars:
+            return self._polars_metrics()
+
         if self.clean_df is None:
             self.clean_data()
 
-        completed_orders = self.clean_df[self.clean_df['status']
-                                         == 'completed']
+        df = self.clean_df
+        status = df['status'].values
+        completed_mask = status == 'completed'
+        cancelled_mask = status == 'cancelled'
+        amounts = df['order_amount'].to_numpy()
+
+        total_revenue = amounts[completed_mask].sum()
+        total_orders = int(completed_mask.sum())
 
         metrics = {
-            'total_revenue': completed_orders['order_amount'].sum(),
-            'total_orders': len(completed_orders),
-            'customer_count': self.clean_df['customer_id'].nunique(),
-            'avg_order_value': completed_orders['order_amount'].mean(),
+            'total_revenue': total_revenue,
+            'total_orders': total_orders,
+            'customer_count': self._customer_counts.size,
+            'avg_order_value': total_revenue / total_orders if total_orders else np.nan,
             'repeat_customer_rate': self._calculate_repeat_rate(),
-            'cancellation_rate': (len(self.clean_df[self.clean_df['status'] == 'cancelled']) / len(self.clean_df)) * 100
+            'cancellation_rate': cancelled_mask.mean() * 100
         }
 
         return metrics
 
-    def _calculate_repeat_rate(self):
+    def _calculate_repeat_rate(self, order_counts=None):
         """Calculate percentage of customers with multiple orders"""
-        order_counts = self.clean_df['customer_id'].value_counts()
-        repeat_customers = len(order_counts[order_counts > 1])
-        total_customers = len(order_counts)
-        return (repeat_customers / total_customers) * 100 if total_customers > 0 else 0
+        if order_counts is None:
+            order_counts = self._customer_counts
+        total_customers = order_counts.size
+        return (order_counts > 1).mean() * 100 if total_customers > 0 else 0
+
+    def stream_metrics(self, chunksize=2**20):
+        """calculate_metrics over the CSV in chunks, without loading it whole
+
+        Applies the same cleaning rules as clean_data chunk by chunk. Only
+        running totals, the seen order ids and per-customer order counts are
+        kept in memory.
+        """
+        total_revenue = 0.0
+        total_orders = 0
+        cancelled_orders = 0
+        valid_orders = 0
+        seen_orders = set()
+        customer_orders = Counter()
+
+        reader = pd.read_csv(
+            self.data_path, chunksize=chunksize,
+            usecols=['order_id', 'customer_id', 'quantity', 'order_amount', 'status'])
+        for chunk in reader:
+            chunk['status'] = chunk['status'].fillna('pending')
+            amounts = pd.to_numeric(chunk['order_amount'], errors='coerce')
+            chunk = chunk.loc[(amounts.to_numpy() > 0)
+                              & (chunk['quantity'].to_numpy() > 0)]
+            # Duplicates may span chunks, so keep the first order_id ever seen
+            chunk = chunk.drop_duplicates(subset=['order_id'], keep='first')
+            # Probe the set per row so each chunk costs O(chunk), not O(seen)
+            seen = chunk['order_id'].map(seen_orders.__contains__).to_numpy(dtype=bool)
+            chunk = chunk.loc[~seen]
+            seen_orders.update(chunk['order_id'])
+
+            status = chunk['status'].to_numpy()
+            completed_mask = status == 'completed'
+            total_revenue += amounts.loc[chunk.index].to_numpy()[completed_mask].sum()
+            total_orders += int(completed_mask.sum())
+            cancelled_orders += int((status == 'cancelled').sum())
+            valid_orders += len(chunk)
+            customer_orders.update(chunk['customer_id'].value_counts().to_dict())
+
+        order_counts = np.fromiter(customer_orders.values(), dtype=np.int64,
+                                   count=len(customer_orders))
+        return {
+            'total_revenue': total_revenue,
+            'total_orders': total_orders,
+            'customer_count': order_counts.size,
+            'avg_order_value': total_revenue / total_orders if total_orders else np.nan,
+            'repeat_customer_rate': self._calculate_repeat_rate(order_counts),
+            'cancellation_rate': (cancelled_orders / valid_orders * 100
+                                  if valid_orders else np.nan)
+        }
 
     def get_top_categories(self, n=5):
         """Get top n categories by revenue"""
-        completed = self.clean_df[self.clean_df['status'] == 'completed']
-        category_revenue = completed.groupby('product_category')[
-            'order_amount'].sum()
-        return category_revenue.sort_values(ascending=False).head(n)
+        if self.use_polars:
+            return self._polars_top('product_category', n)
+        return self._top_by_revenue('product_category', n)
 
     def get_top_customers(self, n=10):
         """Get top n customers by total spending"""
-        completed = self.clean_df[self.clean_df['status'] == 'completed']
-        customer_spending = completed.groupby(
-            'customer_id')['order_amount'].sum()
-        return customer_spending.sort_values(ascending=False).head(n)
+        if self.use_polars:
+            return self._polars_top('customer_id', n)
+        return self._top_by_revenue('customer_id', n)
+
+    def _top_by_revenue(self, column, n):
+        """Top n categories of column by completed revenue, without a full sort"""
+        col = self._completed[column]
+        codes = col.cat.codes.to_numpy()
+        valid = codes >= 0
+        codes = codes[valid]
+        amounts = self._completed['order_amount'].to_numpy()[valid]
+
+        n_groups = len(col.cat.categories)
+        sums = np.bincount(codes, weights=amounts, minlength=n_groups)
+        observed = np.flatnonzero(np.bincount(codes, minlength=n_groups))
+
+        k = min(n, observed.size)
+        if k < observed.size:
+            observed = observed[np.argpartition(-sums[observed], k - 1)[:k]]
+        top = observed[np.argsort(-sums[observed], kind='stable')][:k]
+
+        return pd.Series(sums[top],
+                         index=pd.Index(col.cat.categories[top], name=column),
+                         name='order_amount')
 
     def analyze_seasonal_trends(self):
         """Analyze monthly sales trends"""
-        completed = self.clean_df[self.clean_df['status'] == 'completed']
-        completed['month'] = completed['order_date'].dt.to_period('M')
-        monthly_sales = completed.groupby('month')['order_amount'].sum()
+        if self.use_polars:
+            return self._polars_seasonal_trends()
+        completed = self._completed
+        # datetime64[M] as int64 is months since 1970-01, i.e. a Period ordinal
+        months = completed['order_date'].to_numpy().astype('datetime64[M]')
+        valid = ~np.isnat(months)
+        month_ids, inverse = np.unique(months[valid].astype('int64'),
+                                       return_inverse=True)
+        amounts = completed['order_amount'].to_numpy()[valid]
+        sums = np.bincount(inverse, weights=amounts, minlength=month_ids.size)
+
+        month = pd.PeriodIndex.from_ordinals(month_ids, freq='M').rename('month')
+        monthly_sales = pd.Series(sums, index=month, name='order_amount')
         return monthly_sales
 
     def answer_business_questions(self):
@@ -146,10 +312,90 @@ class SalesAnalyzer:
             "2. Average Order Value": f"${metrics['avg_order_value']:,.2f}",
             "3. Customer Count": metrics['customer_count'],
             "4. Most Profitable Category": self.get_top_categories(1).index[0],
-            "5. Top 10 Customers": self.get_top_customers(10).to_dict(),
+            "5. Top 10 Customers": self.get_top_customers(10),
             "6. Repeat Customer Rate": f"{metrics['repeat_customer_rate']:.1f}%",
-            "7. Monthly Sales Trends": self.analyze_seasonal_trends().to_dict(),
+            "7. Monthly Sales Trends": self.analyze_seasonal_trends(),
             "8. Cancellation Rate": f"{metrics['cancellation_rate']:.1f}%"
         }
 
         return answers
+
+    def _polars_clean(self):
+        """Lazy Polars equivalent of clean_data"""
+        if self.lf is None:
+            self.load_data()
+
+        lf = self.lf
+        if lf.collect_schema()['order_date'] == pl.String:
+            lf = lf.with_columns(
+                pl.col('order_date').str.to_date('%Y-%m-%d', strict=False))
+
+        return (
+            lf
+            .with_columns(
+                pl.col('status').fill_null('pending'),
+                # Same as pd.to_numeric(errors='coerce'): bad values become null
+                pl.col('order_amount').cast(pl.Float64, strict=False))
+            .filter((pl.col('order_amount') > 0) & (pl.col('quantity') > 0))
+            .unique(subset='order_id', keep='first', maintain_order=True)
+        )
+
+    def _polars_completed(self):
+        """Lazy frame of completed orders after cleaning"""
+        return self._polars_clean().filter(pl.col('status') == 'completed')
+
+    def _polars_metrics(self):
+        """calculate_metrics computed by a single Polars query plan"""
+        clean = self._polars_clean()
+        by_status, by_customer = pl.collect_all([
+            clean.group_by('status').agg(pl.col('order_amount').sum(), pl.len()),
+            # Missing ids are not customers, as with value_counts in clean_data
+            clean.filter(pl.col('customer_id').is_not_null())
+            .group_by('customer_id').len(),
+        ])
+
+        status_totals = {row['status']: row for row in by_status.iter_rows(named=True)}
+        completed = status_totals.get('completed', {'order_amount': 0.0, 'len': 0})
+        cancelled = status_totals.get('cancelled', {'len': 0})
+        total_revenue = completed['order_amount']
+        total_orders = completed['len']
+        order_counts = by_customer['len'].to_numpy()
+
+        return {
+            'total_revenue': total_revenue,
+            'total_orders': total_orders,
+            'customer_count': order_counts.size,
+            'avg_order_value': total_revenue / total_orders if total_orders else np.nan,
+            'repeat_customer_rate': self._calculate_repeat_rate(order_counts),
+            'cancellation_rate': cancelled['len'] / by_status['len'].sum() * 100
+        }
+
+    def _polars_top(self, column, n):
+        """Top n values of column by completed revenue, as a pandas Series"""
+        top = (
+            self._polars_completed()
+            .filter(pl.col(column).is_not_null())
+            .group_by(column)
+            .agg(pl.col('order_amount').sum().cast(pl.Float64))
+            .sort('order_amount', descending=True)
+            .head(n)
+            .collect()
+        )
+        return pd.Series(top['order_amount'].to_numpy(),
+                         index=pd.Index(top[column].to_list(), name=column),
+                         name='order_amount')
+
+    def _polars_seasonal_trends(self):
+        """Monthly completed revenue, indexed like analyze_seasonal_trends"""
+        monthly = (
+            self._polars_completed()
+            .filter(pl.col('order_date').is_not_null())
+            .group_by(pl.col('order_date').dt.truncate('1mo').alias('month'))
+            .agg(pl.col('order_amount').sum().cast(pl.Float64))
+            .sort('month')
+            .collect()
+        )
+        month = pd.DatetimeIndex(monthly['month'].to_numpy()).to_period('M')
+        return pd.Series(monthly['order_amount'].to_numpy(),
+                         index=month.rename('month'),
+                         name='order_amount')
@@ -3,12 +3,16 @@ Data Generator for Sales Analytics Platform
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+
+try:
+    import pyarrow
+except ImportError:  # pyarrow is optional, without it only CSV is written
+    pyarrow = None
 
 
 def generate_sample_data(n_orders=200):
     """Generate synthetic sales data for analysis"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     categories = ["Electronics", "Clothing",
                   "Home & Garden", "Sports", "Books"]
@@ -21,35 +25,41 @@ def generate_sample_data(n_orders=200):
         "Books": ["Fiction", "Science", "History", "Art"]
     }
 
-    orders = []
-    start_date = datetime(2023, 1, 1)
-
-    for i in range(n_orders):
-        category = np.random.choice(categories)
-        product = np.random.choice(products[category])
-        qty = np.random.randint(1, 5)
-        unit_price = np.random.uniform(10, 500)
-        amount = qty * unit_price
-        status = np.random.choice(
-            ["completed", "pending", "cancelled", np.nan],
-            p=[0.7, 0.15, 0.1, 0.05]
-        )
+    # Draw every column in one call instead of looping per order
+    category_arr = np.array(categories)
+    product_arr = np.array([products[c] for c in categories])
+    cat_idx = rng.integers(0, len(categories), n_orders)
+    prod_idx = rng.integers(0, product_arr.shape[1], n_orders)
+    qty = rng.integers(1, 5, n_orders)
+    unit_price = rng.uniform(10, 500, n_orders)
+    status = rng.choice(
+        np.array(["completed", "pending", "cancelled", np.nan], dtype=object),
+        size=n_orders,
+        p=[0.7, 0.15, 0.1, 0.05]
+    )
+    customer_num = rng.integers(1, 50, n_orders)
+    day_offset = rng.integers(0, 365, n_orders)
 
-        orders.append({
-            "order_id": f"ORD{1000+i}",
-            "customer_id": f"CUST{np.random.randint(1, 50)}",
-            "order_date": (start_date + timedelta(days=np.random.randint(0, 365))).strftime("%Y-%m-%d"),
-            "product_category": category,
-            "product_name": product,
-            "quantity": qty,
-            "unit_price": round(unit_price, 2),
-            "order_amount": round(amount, 2),
-            "status": status
-        })
+    start_date = pd.Timestamp(2023, 1, 1)
+    order_dates = start_date + pd.to_timedelta(day_offset, unit="D")
 
-    df = pd.DataFrame(orders)
+    df = pd.DataFrame({
+        "order_id": np.char.add("ORD", (1000 + np.arange(n_orders)).astype(str)),
+        "customer_id": np.char.add("CUST", customer_num.astype(str)),
+        "order_date": order_dates.strftime("%Y-%m-%d"),
+        "product_category": category_arr[cat_idx],
+        "product_name": product_arr[cat_idx, prod_idx],
+        "quantity": qty,
+        "unit_price": np.round(unit_price, 2),
+        "order_amount": np.round(qty * unit_price, 2),
+        "status": status
+    })
     df.to_csv("data/sales_data.csv", index=False)
     print(f"✅ Generated {n_orders} orders in data/sales_data.csv")
+    if pyarrow is not None:
+        # Parquet copy lets SalesAnalyzer.load_data skip CSV parsing
+        df.to_parquet("data/sales_data.parquet", engine='pyarrow',
+                      compression='zstd', index=False)
     print(f"📊 Data shape: {df.shape}")
     print(
         f"📅 Date range: {df['order_date'].min()} to {df['order_date'].max()}")
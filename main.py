@@ -1,6 +1,7 @@
-""""
+"""
 Main entry point for Sales Analytics Platform
-""""
+"""
+import pandas as pd
 from analyzer import SalesAnalyzer
 from algorithms import compare_sorting, compare_searching
 
@@ -28,7 +29,7 @@ def main():
     print("="*50)
 
     for question, answer in answers.items():
-        if isinstance(answer, dict):
+        if isinstance(answer, (dict, pd.Series)):
             print(f"\n{question}:")
             for key, value in answer.items():
                 print(f"  {key}: {value}")
@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 class Entity(ABC):
     """Base class for all entities"""
 
+    __slots__ = ('id', 'name')
+
     def __init__(self, entity_id: str, name: str):
         self._validate_id(entity_id)
         self._validate_name(name)
@@ -35,6 +37,8 @@ class Entity(ABC):
 class Product(Entity):
     """Product entity with category and pricing"""
 
+    __slots__ = ('category', 'base_price')
+
     def __init__(self, product_id: str, name: str, category: str, base_price: float):
         super().__init__(product_id, name)
         self.category = category
@@ -63,6 +67,8 @@ class Product(Entity):
 class Customer(Entity):
     """Customer entity with contact information"""
 
+    __slots__ = ('email', 'lifetime_value', 'orders')
+
     def __init__(self, customer_id: str, name: str, email: str, lifetime_value: float = 0.0):
         super().__init__(customer_id, name)
         self.email = email
@@ -103,6 +109,8 @@ class Customer(Entity):
 class Order:
     """Order entity representing a sales transaction"""
 
+    __slots__ = ('order_id', 'date', 'customer', 'items', 'amount', 'status')
+
     VALID_STATUSES = ["pending", "completed", "cancelled"]
 
     def __init__(self, order_id: str, date: str, customer: Customer,
@@ -155,3 +163,25 @@ class EntityFactory:
             name=f"Customer_{row.get('customer_id', 'Unknown')}",
             email=f"customer_{row.get('customer_id', 'unknown')}@example.com"
         )
+
+    @staticmethod
+    def create_products_bulk(df):
+        """Create one Product per distinct product_name in a DataFrame"""
+        rows = (df[['product_name', 'product_category', 'unit_price']]
+                .dropna(subset=['product_name'])
+                .drop_duplicates(subset=['product_name']))
+        return [
+            Product(product_id=name, name=name, category=category,
+                    base_price=float(price))
+            for name, category, price in rows.itertuples(index=False, name=None)
+        ]
+
+    @staticmethod
+    def create_customers_bulk(df):
+        """Create one Customer per distinct customer_id in a DataFrame"""
+        rows = df[['customer_id']].dropna().drop_duplicates()
+        return [
+            Customer(customer_id=customer_id, name=f"Customer_{customer_id}",
+                     email=f"customer_{customer_id}@example.com")
+            for (customer_id,) in rows.itertuples(index=False, name=None)
+        ]
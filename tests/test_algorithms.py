@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import algorithms
+from algorithms import quicksort, quicksort_inplace
+
+
+def test_quicksort_sorts_integer_lists():
+    data = [5, -3, 9, 0, 5, 2]
+    assert quicksort(data) == sorted(data)
+
+
+def test_quicksort_keeps_non_integer_values():
+    assert quicksort([1.7, 1.2, 3]) == [1.2, 1.7, 3]
+    assert quicksort(["b", "a"]) == ["a", "b"]
+
+
+def test_quicksort_returns_array_for_array_input():
+    data = np.array([3, 1, 2])
+    result = quicksort(data)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [1, 2, 3]
+    assert data.tolist() == [3, 1, 2]
+
+
+def test_quicksort_inplace_sorts_buffer():
+    buf = np.array([4, -1, 7, 0], dtype=np.int64)
+    assert quicksort_inplace(buf) is buf
+    assert buf.tolist() == [-1, 0, 4, 7]
+
+
+@pytest.mark.parametrize("data", [
+    np.random.default_rng(0).integers(-10**9, 10**9, 5000),
+    np.random.default_rng(1).integers(0, 3, 5000),
+    np.full(5000, 7),
+])
+def test_parallel_sort_kernel_matches_np_sort(monkeypatch, data):
+    pytest.importorskip("numba")
+    # Force the sample sort path even on small inputs and single-core runners
+    monkeypatch.setattr(algorithms, "PARALLEL_SORT_THRESHOLD", 0)
+    monkeypatch.setattr(algorithms, "get_num_threads", lambda: 4)
+    result = algorithms.parallel_sort(data)
+    assert result.tolist() == np.sort(data).tolist()
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float64, np.uint64])
+def test_quicksort_array_input_keeps_dtype(dtype):
+    data = np.array([3, 1, 2], dtype=dtype)
+    result = quicksort(data)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == dtype
+    assert result.tolist() == [1, 2, 3]
@@ -0,0 +1,186 @@
+import math
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import analyzer as analyzer_module
+from analyzer import SalesAnalyzer
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / "data" / "sales_data.csv"
+
+
+def _write_sales_csv(path):
+    rows = [
+        ("ORD1", "CUST1", "2023-01-05", 1, 100.0, "completed"),
+        ("ORD2", "CUST2", "2023-01-09", 2, 50.0, "cancelled"),
+        ("ORD3", "CUST1", "2023-02-11", 1, 75.0, None),
+        ("ORD4", "CUST3", "2023-02-14", 0, 20.0, "completed"),
+        ("ORD5", "CUST2", "2023-03-01", 3, -5.0, "completed"),
+        ("ORD6", "CUST3", "2023-03-02", 1, 30.0, "completed"),
+        # Duplicate of ORD1 after the first chunk boundary
+        ("ORD1", "CUST4", "2023-03-03", 1, 999.0, "completed"),
+        ("ORD7", "CUST4", "2023-03-04", 2, 40.0, "completed"),
+    ]
+    df = pd.DataFrame(rows, columns=[
+        "order_id", "customer_id", "order_date", "quantity",
+        "order_amount", "status"])
+    df["product_category"] = "Books"
+    df["product_name"] = "Fiction"
+    df["unit_price"] = df["order_amount"]
+    df.to_csv(path, index=False)
+
+
+def test_stream_metrics_matches_calculate_metrics(tmp_path):
+    csv_path = tmp_path / "sales.csv"
+    _write_sales_csv(csv_path)
+    analyzer = SalesAnalyzer(str(csv_path))
+    expected = analyzer.calculate_metrics()
+
+    for chunksize in (2, 3, 100):
+        streamed = analyzer.stream_metrics(chunksize=chunksize)
+        assert streamed.keys() == expected.keys()
+        for key, value in expected.items():
+            assert math.isclose(streamed[key], value), (chunksize, key)
+    assert expected['total_revenue'] == 170.0
+
+
+def test_polars_seasonal_trends_drops_unparseable_dates(tmp_path):
+    pytest.importorskip("polars")
+    csv_path = tmp_path / "sales.csv"
+    pd.DataFrame({
+        "order_id": ["ORD1", "ORD2"],
+        "customer_id": ["CUST1", "CUST2"],
+        "order_date": ["2023-01-05", "bad"],
+        "product_category": ["Books", "Books"],
+        "product_name": ["Fiction", "Fiction"],
+        "quantity": [1, 1],
+        "unit_price": [10, 20],
+        "order_amount": [10, 20],
+        "status": ["completed", "completed"],
+    }).to_csv(csv_path, index=False)
+
+    analyzer = SalesAnalyzer(str(csv_path))
+    analyzer.clean_data()
+    expected = analyzer.analyze_seasonal_trends()
+    polars = SalesAnalyzer(str(csv_path), use_polars=True)
+    polars.load_data()
+    result = polars.analyze_seasonal_trends()
+
+    pd.testing.assert_series_equal(result, expected)
+    assert result.to_dict() == {pd.Period("2023-01", "M"): 10.0}
+
+
+def test_polars_load_data_is_lazy(tmp_path):
+    pytest.importorskip("polars")
+    csv_path = tmp_path / "sales.csv"
+    _write_sales_csv(csv_path)
+
+    analyzer = SalesAnalyzer(str(csv_path), use_polars=True)
+    analyzer.load_data()
+    assert analyzer.raw_df is None
+
+    analyzer.calculate_metrics()
+    assert analyzer.raw_df is None
+
+    analyzer.clean_data()
+    assert len(analyzer.raw_df) == 8
+
+
+def _write_messy_sales_csv(path):
+    df = pd.read_csv(SAMPLE_CSV)
+    df["order_amount"] = df["order_amount"].astype(object)
+    df.loc[3, "order_amount"] = "abc"
+    df.loc[[5, 9], "customer_id"] = None
+    df.to_csv(path, index=False)
+
+
+def test_polars_metrics_match_pandas(tmp_path):
+    pytest.importorskip("polars")
+    csv_path = tmp_path / "sales.csv"
+    _write_messy_sales_csv(csv_path)
+
+    analyzer = SalesAnalyzer(str(csv_path))
+    analyzer.clean_data()
+    expected = analyzer.calculate_metrics()
+    polars = SalesAnalyzer(str(csv_path), use_polars=True)
+    polars.load_data()
+    result = polars.calculate_metrics()
+
+    assert result.keys() == expected.keys()
+    for key, value in expected.items():
+        assert math.isclose(result[key], value), key
+
+    expected_top = analyzer.get_top_customers(60)
+    result_top = polars.get_top_customers(60)
+    assert sorted(result_top.index) == sorted(expected_top.index)
+    assert result_top.sort_index().to_numpy() == pytest.approx(
+        expected_top.sort_index().to_numpy())
+
+
+def _write_csv_and_parquet(tmp_path, parquet_age):
+    """CSV with 8 orders and a Parquet sibling holding only the first 3"""
+    csv_path = tmp_path / "sales.csv"
+    _write_sales_csv(csv_path)
+    pd.read_csv(csv_path).head(3).to_parquet(tmp_path / "sales.parquet")
+    csv_mtime = os.path.getmtime(csv_path)
+    os.utime(tmp_path / "sales.parquet",
+             (csv_mtime + parquet_age, csv_mtime + parquet_age))
+    return csv_path
+
+
+def test_load_data_prefers_fresh_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = _write_csv_and_parquet(tmp_path, parquet_age=10)
+    assert len(SalesAnalyzer(str(csv_path)).load_data()) == 3
+
+
+def test_load_data_ignores_stale_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = _write_csv_and_parquet(tmp_path, parquet_age=-10)
+    assert len(SalesAnalyzer(str(csv_path)).load_data()) == 8
+
+
+def test_load_data_reads_csv_without_pyarrow(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    csv_path = _write_csv_and_parquet(tmp_path, parquet_age=10)
+    monkeypatch.setattr(analyzer_module, "pyarrow", None)
+    assert len(SalesAnalyzer(str(csv_path)).load_data()) == 8
+
+
+@pytest.mark.parametrize("column", ["customer_id", "product_category"])
+@pytest.mark.parametrize("n", [1, 2, 10])
+def test_top_by_revenue_matches_groupby(tmp_path, column, n):
+    csv_path = tmp_path / "sales.csv"
+    _write_sales_csv(csv_path)
+    analyzer = SalesAnalyzer(str(csv_path))
+    analyzer.clean_data()
+    completed = analyzer._completed
+
+    expected = (completed.groupby(column, observed=True)['order_amount'].sum()
+                .sort_values(ascending=False).head(n))
+    result = analyzer._top_by_revenue(column, n)
+
+    # CUST2 only has a cancelled order, so it must not show up at all
+    assert "CUST2" not in result.index
+    assert list(result.index) == list(expected.index)
+    assert result.to_numpy() == pytest.approx(expected.to_numpy())
+
+
+def test_analyze_seasonal_trends_matches_period_groupby(tmp_path):
+    csv_path = tmp_path / "sales.csv"
+    df = pd.read_csv(SAMPLE_CSV)
+    df.loc[[0, 7], "order_date"] = "bad"
+    df.to_csv(csv_path, index=False)
+    analyzer = SalesAnalyzer(str(csv_path))
+    analyzer.clean_data()
+    completed = analyzer._completed
+
+    month = completed['order_date'].dt.to_period('M').rename('month')
+    expected = completed.groupby(month)['order_amount'].sum()
+    result = analyzer.analyze_seasonal_trends()
+
+    assert list(result.index) == list(expected.index)
+    assert result.index.name == "month"
+    assert result.to_numpy() == pytest.approx(expected.to_numpy())
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from models import EntityFactory
+
+
+def _orders_frame():
+    return pd.DataFrame({
+        "customer_id": ["CUST1", "CUST2", "CUST1", np.nan],
+        "product_name": ["Lamp", "Rug", "Lamp", np.nan],
+        "product_category": ["Home & Garden"] * 4,
+        "unit_price": [20.0, 80.0, 25.0, 10.0],
+    }).astype({"customer_id": "category", "product_name": "category"})
+
+
+def test_create_customers_bulk_skips_duplicates_and_missing_ids():
+    customers = EntityFactory.create_customers_bulk(_orders_frame())
+    assert [c.id for c in customers] == ["CUST1", "CUST2"]
+    assert customers[0].email == "customer_CUST1@example.com"
+
+
+def test_create_products_bulk_keeps_first_row_per_product():
+    df = _orders_frame()
+    products = EntityFactory.create_products_bulk(df)
+    assert [p.id for p in products] == ["Lamp", "Rug"]
+    assert products[0].base_price == 20.0
+    expected = EntityFactory.create_product_from_row(df.iloc[0])
+    assert products[0].to_dict() == expected.to_dict()
@@ -0,0 +1,27 @@
+from datetime import date
+
+import pandas as pd
+
+from utils import check_email, check_email_vec, validate_dates
+
+
+def test_check_email():
+    assert check_email("a@b.co")
+    assert not check_email("a.b@c")
+    assert not check_email("a b@c.d")
+    assert not check_email("a@b.co\n")
+
+
+def test_check_email_vec():
+    emails = pd.Series(["a@b.co", "a@b.co\n", "ab", None])
+    assert check_email_vec(emails).tolist() == [True, False, False, False]
+
+
+def test_validate_dates_tries_each_format():
+    dates = ["2023-01-05", "01/02/2023", "05-03-2023", "2023/04/01",
+             "garbage", None]
+    result = validate_dates(dates).tolist()
+    assert result[:4] == [date(2023, 1, 5), date(2023, 1, 2),
+                          date(2023, 3, 5), date(2023, 4, 1)]
+    assert result[4] is pd.NaT
+    assert result[5] is pd.NaT
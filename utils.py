@@ -1,9 +1,12 @@
 """
 Utility functions for Sales Analytics Platform
 """
+import re
 import pandas as pd
 from datetime import datetime
 
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
 
 def validate_date(date_str, format="%Y-%m-%d"):
     """Validate and standardize date format"""
@@ -18,6 +21,19 @@ def validate_date(date_str, format="%Y-%m-%d"):
         raise ValueError(f"Cannot parse date: {date_str}")
 
 
+def validate_dates(dates, format="%Y-%m-%d"):
+    """Vectorized validate_date for a Series of date strings (NaT if unparseable)"""
+    dates = pd.Series(dates).astype(str)
+    parsed = pd.to_datetime(dates, format=format, errors='coerce', cache=True)
+    for fmt in ["%m/%d/%Y", "%d-%m-%Y", "%Y/%m/%d"]:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(dates[missing], format=fmt,
+                                         errors='coerce', cache=True)
+    return parsed.dt.date
+
+
 def clean_amount(amount):
     """Clean and convert amount to float"""
     if isinstance(amount, str):
@@ -35,4 +51,9 @@ def format_currency(amount):
 
 def check_email(email):
     """Validate email format"""
-    return "@" in email and "." in email
+    return _EMAIL_RE.fullmatch(email) is not None
+
+
+def check_email_vec(emails):
+    """Vectorized check_email for a Series of email strings"""
+    return emails.str.fullmatch(_EMAIL_RE, na=False)